@@ -13,33 +13,68 @@ bl_info = {
 import bpy
 import os
 import platform
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from bpy.types import Operator, Panel, PropertyGroup, UIList
 from bpy.props import StringProperty, BoolProperty, EnumProperty, CollectionProperty, IntProperty
+from bpy.app.handlers import persistent
 
 
 # -----------------------------------------------------------------------------
 # Utility Functions
 # -----------------------------------------------------------------------------
+# Object type checkbox and the object type it enables, in export mask bit order
+_OBJECT_TYPE_PROPS = (
+    ("export_empty",    'EMPTY'),
+    ("export_camera",   'CAMERA'),
+    ("export_lamp",     'LIGHT'),
+    ("export_armature", 'ARMATURE'),
+    ("export_mesh",     'MESH'),
+    ("export_other",    'OTHER'),
+)
+
+# Allowed object types for every combination of the export type checkboxes
+_ALLOWED_TYPE_TABLE = tuple(
+    frozenset(t for bit, (_, t) in enumerate(_OBJECT_TYPE_PROPS) if mask & (1 << bit))
+    for mask in range(1 << len(_OBJECT_TYPE_PROPS))
+)
+
+
+def allowed_types_mask(props):
+    """
+    Pack the object type checkboxes into a bitmask indexing
+    _ALLOWED_TYPE_TABLE (bit order follows _OBJECT_TYPE_PROPS).
+    """
+    return sum(bool(getattr(props, attr)) << bit for bit, (attr, _) in enumerate(_OBJECT_TYPE_PROPS))
+
+
+def get_allowed_types(props):
+    """
+    Returns the frozenset of object types enabled by the type checkboxes.
+    """
+    return _ALLOWED_TYPE_TABLE[allowed_types_mask(props)]
+
+
 def gather_top_level_collections(context):
     """
-    Recursively gather all visible collections from the view layer and return
-    those with no parent.
+    Gather the visible collections of the view layer that have no parent.
+    These are exactly the visible direct children of the root layer collection.
     """
-    all_visible = set()
-    child_to_parent = {}
+    return [
+        lc.collection for lc in context.view_layer.layer_collection.children
+        if not lc.hide_viewport and not lc.collection.hide_viewport
+    ]
+
 
-    def recurse_layer_coll(layer_coll, parent_coll):
-        if not layer_coll.hide_viewport and not layer_coll.collection.hide_viewport:
-            all_visible.add(layer_coll.collection)
-            if parent_coll is not None:
-                child_to_parent[layer_coll.collection] = parent_coll
-        for child in layer_coll.children:
-            recurse_layer_coll(child, layer_coll.collection)
+# UV layer count per mesh datablock, cleared on every depsgraph update
+_uv_layer_counts = {}
 
-    for lc in context.view_layer.layer_collection.children:
-        recurse_layer_coll(lc, None)
 
-    return [c for c in all_visible if c not in child_to_parent]
+def _uv_layer_count(mesh):
+    count = _uv_layer_counts.get(mesh)
+    if count is None:
+        count = _uv_layer_counts[mesh] = len(mesh.uv_layers)
+    return count
 
 
 def all_have_2nd_uv_layer(objects):
@@ -47,31 +82,72 @@ def all_have_2nd_uv_layer(objects):
     Returns True if at least one mesh is found AND each mesh has >=2 UV layers.
     If no mesh is found, returns False by default.
     """
-    mesh_found = False
-    for obj in objects:
-        if obj.type == 'MESH':
-            mesh_found = True
-            if len(obj.data.uv_layers) < 2:
-                return False
-    return mesh_found  # If no meshes found, returns False
+    meshes = [o.data for o in objects if o.type == 'MESH']
+    return bool(meshes) and all(_uv_layer_count(mesh) >= 2 for mesh in meshes)
 
 
-def gather_all_objects_recursive(collection, allowed_types):
+def gather_exportable_objects(context, allowed_types):
+    """
+    Snapshot the visible view layer objects whose type is in allowed_types.
+    Filter loops test membership in this set instead of reading o.type and
+    o.hide_viewport for every object of every collection.
+    """
+    objects = context.view_layer.objects
+    # Read all visibility flags in one bulk call
+    hidden = [False] * len(objects)
+    objects.foreach_get("hide_viewport", hidden)
+    return frozenset(
+        o for o, is_hidden in zip(objects, hidden)
+        if not is_hidden and o.type in allowed_types
+    )
+
+
+def gather_all_objects_recursive(collection, exportable):
     """
     Gather all objects from a collection and its child collections.
+    Walks the collection tree with an explicit stack, in depth-first order.
     """
     all_objects = []
-    
-    # Add direct objects from this collection
-    all_objects.extend([o for o in collection.objects if o.type in allowed_types and not o.hide_viewport])
-    
-    # Recursively add objects from child collections
-    for child_coll in collection.children:
-        all_objects.extend(gather_all_objects_recursive(child_coll, allowed_types))
-    
+    stack = [collection]
+
+    while stack:
+        coll = stack.pop()
+        # Add direct objects from this collection
+        all_objects.extend(o for o in coll.objects if o in exportable)
+        # Push children reversed so they are visited in their original order
+        stack.extend(reversed(coll.children))
+
     return all_objects
 
 
+def gather_selected_by_collection(selected_objs):
+    """
+    Group selected objects by the collections they belong to.
+    Returns a dict of collection -> list of objects.
+    """
+    coll_map = defaultdict(list)
+    for obj in selected_objs:
+        for coll in obj.users_collection:
+            coll_map[coll].append(obj)
+    return dict(coll_map)
+
+
+def select_only(objects, selected):
+    """
+    Make the given objects the only selected ones, given the objects that
+    are currently selected. Only the difference is toggled, directly instead
+    of running the select_all operator.
+    """
+    keep = set(objects)
+    already = set(selected)
+    for o in selected:
+        if o not in keep:
+            o.select_set(False)
+    for o in objects:
+        if o not in already:
+            o.select_set(True)
+
+
 def check_path_exists(path):
     """
     Check if the drive/path exists and is accessible.
@@ -80,43 +156,66 @@ def check_path_exists(path):
     # Check if the path exists first
     if os.path.exists(path):
         return True, ""
-    
+
     # For Windows, check if the drive exists
     if platform.system() == "Windows":
         drive = os.path.splitdrive(path)[0]
-        if drive and not os.path.exists(drive):
+        if drive and not os.path.exists(drive + os.sep):
             return False, f"Drive '{drive}' does not exist or is not accessible."
-    
-    # For other cases, check if the parent directory chain exists
+
+    # Report the parent instead if it is missing too
     parent_dir = os.path.dirname(path)
-    if parent_dir and not os.path.exists(parent_dir):
-        return check_path_exists(parent_dir)
-    
+    if parent_dir and parent_dir != path and not os.path.exists(parent_dir):
+        return False, f"Path '{parent_dir}' is not accessible."
+
     return False, f"Path '{path}' is not accessible."
 
 
-def ensure_directory_exists(directory_path):
+def ensure_directory_exists(directory_path, ensured=None):
     """
     Ensures a directory exists, creates it if it doesn't.
+    If a set of already ensured directories is given, those are skipped and
+    newly ensured ones are added to it.
     Returns (success, message)
     """
-    try:
-        # First check if the directory or its drive exists
-        exists, msg = check_path_exists(os.path.dirname(directory_path))
-        if not exists:
-            return False, msg
-        
-        # Try to create the directory if it doesn't exist
-        if not os.path.exists(directory_path):
-            os.makedirs(directory_path, exist_ok=True)
+    key = os.path.normpath(directory_path)
+    if ensured is not None and key in ensured:
         return True, ""
+
+    try:
+        # Create the directory straight away; existing ones are a no-op
+        os.makedirs(directory_path, exist_ok=True)
     except PermissionError:
         return False, f"Permission denied: Cannot create directory '{directory_path}'"
     except FileNotFoundError:
+        # Only now work out whether the drive or parent is the problem
+        exists, msg = check_path_exists(os.path.dirname(directory_path))
+        if not exists:
+            return False, msg
         return False, f"Path not found: Cannot create directory '{directory_path}'"
     except Exception as e:
         return False, f"Error creating directory '{directory_path}': {str(e)}"
 
+    if ensured is not None:
+        ensured.add(key)
+    return True, ""
+
+
+def list_subdirectories(parent_dir, listings):
+    """
+    Returns the names of the directories inside parent_dir. Each parent is
+    scanned once per listings dict; a missing parent yields an empty set.
+    """
+    names = listings.get(parent_dir)
+    if names is None:
+        try:
+            with os.scandir(parent_dir) as entries:
+                names = {e.name for e in entries if e.is_dir()}
+        except OSError:
+            names = set()
+        listings[parent_dir] = names
+    return names
+
 
 # -----------------------------------------------------------------------------
 # Item class for exported files list
@@ -307,52 +406,50 @@ class VRSE3D_OT_export_selected(Operator):
             context.window_manager.fileselect_add(self)
             return {'RUNNING_MODAL'}
 
-    def get_object_types(self, context):
-        props = context.scene.vrsefbx_exporter
-        t = set()
-        if props.export_empty: t.add('EMPTY')
-        if props.export_camera: t.add('CAMERA')
-        if props.export_lamp: t.add('LIGHT')
-        if props.export_armature: t.add('ARMATURE')
-        if props.export_mesh: t.add('MESH')
-        if props.export_other: t.add('OTHER')
-        return t
-
-    def export_fbx(self, context, filepath, objects):
+    def build_fbx_kwargs(self, props):
+        """
+        Build the FBX exporter arguments shared by every file of one export.
+        Everything except the filepath comes from the addon properties.
+        """
+        # Prepare object types to export based on checkboxes
+        ex_object_types = set(get_allowed_types(props))
+        if props.export_animations: ex_object_types.add('ARMATURE')
+
+        return dict(
+            check_existing=False,
+            filter_glob="*.fbx",
+            use_selection=True,
+            object_types=ex_object_types,
+            bake_anim=props.export_animations,
+            bake_anim_use_all_bones=props.export_animations,
+            bake_anim_use_all_actions=props.export_animations,
+            use_armature_deform_only=True,
+            bake_space_transform=props.apply_transform,
+            mesh_smooth_type=props.export_smoothing,
+            add_leaf_bones=False,
+            embed_textures=props.embed_textures,
+            path_mode='COPY' if props.embed_textures else 'AUTO',
+            # Transform options
+            axis_forward=props.axis_forward,
+            axis_up=props.axis_up,
+            global_scale=1.0,
+            apply_unit_scale=props.apply_unit,
+            use_space_transform=props.use_space_transform,
+            apply_scale_options=props.apply_scale_options,
+            use_mesh_modifiers=props.apply_modifiers,
+        )
+
+    def export_fbx(self, context, directory, file_name, objects):
         """Calls Blender's native FBX exporter with Unity-compatible parameters."""
         if not objects:
             return False  # Safety: if no objects, do nothing
 
-        props = context.scene.vrsefbx_exporter
-
-        # Prepare object types to export based on checkboxes
-        ex_object_types = set()
-        if props.export_mesh: ex_object_types.add('MESH')
-        if props.export_armature or props.export_animations: ex_object_types.add('ARMATURE')
-        if props.export_empty: ex_object_types.add('EMPTY')
-        if props.export_camera: ex_object_types.add('CAMERA')
-        if props.export_lamp: ex_object_types.add('LIGHT')
-        if props.export_other: ex_object_types.add('OTHER')
-
-        # Ensure the directory exists
-        success, msg = ensure_directory_exists(os.path.dirname(filepath))
-        if not success:
-            self.report({'ERROR'}, msg)
-            return False
-
-        # Ensure we're in OBJECT mode
-        if bpy.context.mode != 'OBJECT':
-            try:
-                bpy.ops.object.mode_set(mode='OBJECT')
-            except Exception:
-                pass  # Suppress errors if mode switch fails
+        filepath = f"{directory}{file_name}"
 
-        # Deselect all, then select only the valid objects
-        bpy.ops.object.select_all(action='DESELECT')
-        view_objs = list(context.view_layer.objects)
-        valid_objects = [o for o in objects if o in view_objs]
-        for o in valid_objects:
-            o.select_set(True)
+        # Select only the valid objects
+        valid_objects = [o for o in objects if o in self._view_objs]
+        select_only(valid_objects, self._selected)
+        self._selected = valid_objects
 
         # Attempt to set the first object as active
         if valid_objects:
@@ -360,156 +457,165 @@ class VRSE3D_OT_export_selected(Operator):
 
         try:
             # Call FBX export
-            bpy.ops.export_scene.fbx(
-                check_existing=False,
-                filepath=filepath,
-                filter_glob="*.fbx",
-                use_selection=True,
-                object_types=ex_object_types,
-                bake_anim=props.export_animations,
-                bake_anim_use_all_bones=props.export_animations,
-                bake_anim_use_all_actions=props.export_animations,
-                use_armature_deform_only=True,
-                bake_space_transform=props.apply_transform,
-                mesh_smooth_type=props.export_smoothing,
-                add_leaf_bones=False,
-                embed_textures=props.embed_textures,
-                path_mode='COPY' if props.embed_textures else 'AUTO',
-                # Transform options
-                axis_forward=props.axis_forward,
-                axis_up=props.axis_up,
-                global_scale=1.0,
-                apply_unit_scale=props.apply_unit,
-                use_space_transform=props.use_space_transform,
-                apply_scale_options=props.apply_scale_options,
-                use_mesh_modifiers=props.apply_modifiers,
-            )
-            
-            # Add the exported file to our list
-            item = props.exported_files.add()
-            item.name = os.path.basename(filepath)
-            item.file_path = filepath
+            bpy.ops.export_scene.fbx(filepath=filepath, **self._fbx_kwargs)
             
+            # Remember the exported file; the list is filled once at the end
+            self._pending_results.append((file_name, filepath))
             return True
         except Exception as e:
-            self.report({'ERROR'}, f"Error exporting to {filepath}: {str(e)}")
+            self._errors.append(f"Error exporting to {filepath}: {str(e)}")
             return False
 
-    def export_collection_recursive(self, context, collection, parent_dir, allowed_types, create_subfolder=True):
-        """Recursively export each collection into a subfolder if needed."""
-        props = context.scene.vrsefbx_exporter
-        exported_count = 0
-
-        # Create subfolder if needed
-        if create_subfolder:
-            coll_folder = os.path.join(parent_dir, collection.name)
-            success, msg = ensure_directory_exists(coll_folder)
-            if not success:
-                self.report({'ERROR'}, msg)
-                return 0
-        else:
-            coll_folder = parent_dir
+    def run_export_jobs(self, context):
+        """
+        Run the queued (directory, file_name, objects) exports, where directory
+        ends with a separator; jobs without objects only create their directory.
+        The target directories are created in parallel first, then the FBX files
+        are written one at a time on the main thread, since bpy data and
+        operators are not thread-safe.
+        Returns the number of exported files.
+        """
+        jobs = self._export_jobs
+        self._export_jobs = []
+
+        # Ensure we're in OBJECT mode, once and only if there is something to export
+        if any(objects for _, _, objects in jobs) and context.mode != 'OBJECT':
+            try:
+                bpy.ops.object.mode_set(mode='OBJECT')
+            except Exception:
+                pass  # Suppress errors if mode switch fails
 
-        if props.combine_nested_collections and collection.children:
-            # Combine all objects from this collection and its child collections
-            all_objects = gather_all_objects_recursive(collection, allowed_types)
-            
-            if all_objects:
-                # Export as a single FBX with parent collection name
-                export_path = os.path.join(coll_folder, f"{collection.name}.fbx")
-                if self.export_fbx(context, export_path, all_objects):
-                    exported_count += 1
-        else:
-            # Standard export mode - export each collection separately
-            # Filter objects in this collection that match allowed_types & are visible
-            direct_objs = [
-                o for o in collection.objects
-                if o.type in allowed_types and not o.hide_viewport
-            ]
-            
-            # If no direct objects, we might still check children
-            has_any_direct = bool(direct_objs)
-
-            # Export a single FBX for the direct objects in this collection
-            if has_any_direct:
-                export_path = os.path.join(coll_folder, f"{collection.name}.fbx")
-                if self.export_fbx(context, export_path, direct_objs):
-                    exported_count += 1
-
-            # Then handle child collections
-            if props.separate_child_collections:
-                for child_coll in collection.children:
-                    exported_count += self.export_collection_recursive(
-                        context, child_coll, coll_folder, allowed_types, create_subfolder=True
-                    )
+        directories = list(dict.fromkeys(directory for directory, _, _ in jobs))
+
+        # Folders already listed in their parent need no mkdir; sibling
+        # folders share a single scan of the parent
+        dir_ok = {}
+        pending = []
+        listings = {}
+        for directory in directories:
+            key = os.path.normpath(directory)
+            if key in self._ensured_dirs:
+                dir_ok[directory] = True
+            elif os.path.basename(key) in list_subdirectories(os.path.dirname(key), listings):
+                self._ensured_dirs.add(key)
+                dir_ok[directory] = True
             else:
-                for child_coll in collection.children:
-                    exported_count += self.export_collection_recursive(
-                        context, child_coll, coll_folder, allowed_types, create_subfolder=False
-                    )
+                pending.append(directory)
+
+        if pending:
+            # Create shallower folders first, so that once a folder fails the
+            # ones below it are skipped with a single error, as before
+            by_depth = defaultdict(list)
+            for directory in pending:
+                by_depth[directory.count(os.sep)].append(directory)
+            failed = set()
+
+            with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(pending))) as pool:
+                for depth in sorted(by_depth):
+                    futures = {}
+                    for directory in by_depth[depth]:
+                        key = os.path.normpath(directory)
+                        parent = os.path.dirname(key)
+                        while parent not in failed and os.path.dirname(parent) != parent:
+                            parent = os.path.dirname(parent)
+                        if parent in failed:
+                            failed.add(key)
+                            dir_ok[directory] = False
+                        else:
+                            futures[directory] = pool.submit(ensure_directory_exists, directory, self._ensured_dirs)
+
+                    for directory, future in futures.items():
+                        success, msg = future.result()
+                        if not success:
+                            self._errors.append(msg)
+                            failed.add(os.path.normpath(directory))
+                        dir_ok[directory] = success
 
-        return exported_count
+        export_count = 0
+        for directory, file_name, objects in jobs:
+            if objects and dir_ok[directory] and self.export_fbx(context, directory, file_name, objects):
+                export_count += 1
 
-    def gather_selected_by_collection(self, selected_objs):
-        """Group selected objects by the collections they belong to."""
-        coll_map = {}
-        for obj in selected_objs:
-            for coll in obj.users_collection:
-                coll_map.setdefault(coll, []).append(obj)
-        return coll_map
+        # Report all failures of this batch at once
+        if self._errors:
+            self.report({'ERROR'}, "\n".join(self._errors))
+        return export_count
+
+    def queue_collection_exports(self, props, collection, parent_dir, exportable):
+        """
+        Queue an export of a collection into its own subfolder, and of its
+        child collections into subfolders if needed. Walks the tree with an
+        explicit stack.
+        """
+        combine_nested = props.combine_nested_collections
+        child_subfolders = props.separate_child_collections
+        stack = [(collection, parent_dir, True)]
+
+        while stack:
+            coll, coll_folder, subfolder = stack.pop()
+
+            # Use a subfolder if needed, created even if nothing ends up in it
+            if subfolder:
+                coll_folder = f"{coll_folder}{coll.name}{os.sep}"
+                self._export_jobs.append((coll_folder, None, None))
+
+            children = coll.children
+            if combine_nested and children:
+                # Combine all objects from this collection and its child collections
+                all_objects = gather_all_objects_recursive(coll, exportable)
+                if all_objects:
+                    # Export as a single FBX with parent collection name
+                    self._export_jobs.append((coll_folder, f"{coll.name}.fbx", all_objects))
+                continue
+
+            # Standard export mode - export each collection separately
+            # Filter objects in this collection that match allowed_types & are visible
+            direct_objs = [o for o in coll.objects if o in exportable]
+            if direct_objs:
+                self._export_jobs.append((coll_folder, f"{coll.name}.fbx", direct_objs))
+
+            # Then handle child collections, pushed reversed to keep their order
+            stack.extend((child, coll_folder, child_subfolders) for child in reversed(children))
 
-    def export_selected_as_collections(self, context, coll_map, parent_coll, parent_dir, visited):
+    def export_selected_as_collections(self, coll_map, children_map, parent_coll, parent_dir, visited):
         """Similar recursion for selected objects grouped by collection."""
-        exported_count = 0
         if parent_coll in visited:
-            return 0
+            return
         visited.add(parent_coll)
 
-        coll_folder = os.path.join(parent_dir, parent_coll.name)
-        success, msg = ensure_directory_exists(coll_folder)
-        if not success:
-            self.report({'ERROR'}, msg)
-            return 0
+        coll_folder = f"{parent_dir}{parent_coll.name}{os.sep}"
 
-        # If we have objects mapped to this collection, export them
+        # If we have objects mapped to this collection, queue their export
         if parent_coll in coll_map:
             objs = coll_map[parent_coll]
             if objs:
-                export_path = os.path.join(coll_folder, f"{parent_coll.name}.fbx")
-                if self.export_fbx(context, export_path, objs):
-                    exported_count += 1
+                self._export_jobs.append((coll_folder, f"{parent_coll.name}.fbx", objs))
 
         # Recurse into child collections
-        for child in parent_coll.children:
-            if child in coll_map:
-                exported_count += self.export_selected_as_collections(context, coll_map, child, coll_folder, visited)
-        return exported_count
+        for child in children_map.get(parent_coll, ()):
+            self.export_selected_as_collections(coll_map, children_map, child, coll_folder, visited)
 
-    def export_selected_each_object(self, context, selected_objs, directory):
-        """Export each selected object as its own FBX."""
-        props = context.scene.vrsefbx_exporter
-        export_count = 0
+    def export_selected_each_object(self, props, selected_objs, directory):
+        """Queue an export of each selected object as its own FBX."""
+        separate_folders = props.make_separate_folders
+        sep = os.sep
         for obj in selected_objs:
-            if props.make_separate_folders:
-                obj_folder = os.path.join(directory, obj.name)
-                success, msg = ensure_directory_exists(obj_folder)
-                if not success:
-                    self.report({'ERROR'}, msg)
-                    continue
-                export_path = os.path.join(obj_folder, f"{obj.name}.fbx")
+            if separate_folders:
+                obj_folder = f"{directory}{obj.name}{sep}"
             else:
-                export_path = os.path.join(directory, f"{obj.name}.fbx")
-            
-            if self.export_fbx(context, export_path, [obj]):
-                export_count += 1
-        return export_count
+                obj_folder = directory
+            self._export_jobs.append((obj_folder, f"{obj.name}.fbx", [obj]))
 
     def execute(self, context):
         props = context.scene.vrsefbx_exporter
         
         # Clear previous exported files list
         props.exported_files.clear()
-        
+        self._ensured_dirs = set()
+        self._export_jobs = []
+        self._pending_results = []
+        self._errors = []
+
         # Convert relative -> absolute path
         self.directory = bpy.path.abspath(self.directory)
         
@@ -520,28 +626,38 @@ class VRSE3D_OT_export_selected(Operator):
             return {'CANCELLED'}
             
         # Try to create the directory
-        success, msg = ensure_directory_exists(self.directory)
+        success, msg = ensure_directory_exists(self.directory, self._ensured_dirs)
         if not success:
             self.report({'ERROR'}, msg)
             return {'CANCELLED'}
 
+        # Export paths are built by plain concatenation onto folder paths that
+        # end with exactly one separator (normpath keeps it on a drive root)
+        export_dir = os.path.normpath(self.directory)
+        if not export_dir.endswith(os.sep):
+            export_dir += os.sep
+
         orig_sel = context.selected_objects[:]
+        # Exports track the selection themselves, so only changes are toggled
+        self._selected = orig_sel
         orig_active = context.active_object
 
-        allowed_types = self.get_object_types(context)
+        # The view layer and export settings don't change while exporting,
+        # so snapshot them once
+        self._view_objs = set(context.view_layer.objects)
+        self._fbx_kwargs = self.build_fbx_kwargs(props)
+
+        allowed_types = get_allowed_types(props)
 
         if props.export_mode == 'COLLECTIONS':
+            exportable = gather_exportable_objects(context, allowed_types)
             top_colls = gather_top_level_collections(context)
             # Filter to collections that have at least 1 visible object in allowed_types
-            valid_colls = []
-            for c in top_colls:
-                col_objs = [o for o in c.all_objects if o.type in allowed_types and not o.hide_viewport]
-                if col_objs:
-                    valid_colls.append(c)
+            valid_colls = [c for c in top_colls if any(o in exportable for o in c.all_objects)]
 
-            export_count = 0
             for coll in valid_colls:
-                export_count += self.export_collection_recursive(context, coll, self.directory, allowed_types, True)
+                self.queue_collection_exports(props, coll, export_dir, exportable)
+            export_count = self.run_export_jobs(context)
 
             self.report({'INFO'}, f"Exported {export_count} FBX files (Collections mode).")
 
@@ -553,22 +669,22 @@ class VRSE3D_OT_export_selected(Operator):
 
             if props.as_single_mesh and props.make_separate_folders:
                 # Group selected objects by collection
-                coll_map = self.gather_selected_by_collection(sel_objects)
-                all_colls = list(coll_map.keys())
-                top_level = []
-                for c in all_colls:
-                    # Check if c is child of another c
-                    is_child = any(
-                        (c.name in [child.name for child in other_coll.children])
-                        for other_coll in all_colls if other_coll != c
-                    )
-                    if not is_child:
-                        top_level.append(c)
-
-                export_count = 0
+                coll_map = gather_selected_by_collection(sel_objects)
+                # Read each collection's children once; only mapped ones matter
+                children_map = {
+                    c: [child for child in c.children if child in coll_map]
+                    for c in coll_map
+                }
+                # A collection is top level unless it is a child of another one
+                all_children = set()
+                for children in children_map.values():
+                    all_children.update(children)
+                top_level = [c for c in coll_map if c not in all_children]
+
                 visited = set()
                 for top_coll in top_level:
-                    export_count += self.export_selected_as_collections(context, coll_map, top_coll, self.directory, visited)
+                    self.export_selected_as_collections(coll_map, children_map, top_coll, export_dir, visited)
+                export_count = self.run_export_jobs(context)
 
                 self.report({'INFO'}, f"Exported {export_count} FBX files (Single Mesh + Separate Folders).")
 
@@ -577,26 +693,27 @@ class VRSE3D_OT_export_selected(Operator):
                 export_name = "combined_export"
                 if context.active_object and context.active_object.users_collection:
                     export_name = context.active_object.users_collection[0].name
-                export_path = os.path.join(self.directory, f"{export_name}.fbx")
-                if self.export_fbx(context, export_path, sel_objects):
-                    export_count = 1
-                else:
-                    export_count = 0
+                self._export_jobs.append((export_dir, f"{export_name}.fbx", sel_objects))
+                export_count = self.run_export_jobs(context)
                 self.report({'INFO'}, f"Exported single FBX with all selected objects: {export_name}.fbx")
 
             else:
                 # Export each object separately
-                export_count = self.export_selected_each_object(context, sel_objects, self.directory)
+                self.export_selected_each_object(props, sel_objects, export_dir)
+                export_count = self.run_export_jobs(context)
                 self.report({'INFO'}, f"Exported {export_count} objects separately.")
 
         # Restore original selection and active object
-        bpy.ops.object.select_all(action='DESELECT')
-        for o in orig_sel:
-            if o:
-                o.select_set(True)
+        select_only([o for o in orig_sel if o], self._selected)
         if orig_active:
             context.view_layer.objects.active = orig_active
 
+        # Add the exported files to our list in one go
+        for name, file_path in self._pending_results:
+            item = props.exported_files.add()
+            item.name = name
+            item.file_path = file_path
+
         # Open the exported files dialog if any files were exported
         if len(props.exported_files) > 0:
             bpy.ops.vrse.show_exported_files('INVOKE_DEFAULT')
@@ -643,6 +760,37 @@ class VRSE3D_OT_show_exported_files(Operator):
 # -----------------------------------------------------------------------------
 # Panel
 # -----------------------------------------------------------------------------
+# Disclosure triangle icon for a collapsed (False) or expanded (True) section
+_TRIA = ("TRIA_RIGHT", "TRIA_DOWN")
+
+
+def _collapse_header(box, props, flag_attr, label):
+    """
+    Draw a collapsible section header toggled by the boolean property
+    flag_attr. Returns True if the section is expanded.
+    """
+    expanded = getattr(props, flag_attr)
+    row = box.row()
+    row.prop(props, flag_attr, text="", icon=_TRIA[expanded], emboss=False)
+    row.label(text=label)
+    return expanded
+
+
+# Bumped on every depsgraph update, so the panel can tell when its cached
+# export summary may be stale
+_depsgraph_update_count = 0
+
+# Last export summary drawn by the panel and the scene state it was built from
+_panel_cache = {}
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    global _depsgraph_update_count
+    _depsgraph_update_count += 1
+    _uv_layer_counts.clear()
+
+
 class VRSE3D_PT_panel(Panel):
     """Panel in the 3D View sidebar for VRse FBX Batch Exporter"""
     bl_label = "VRse FBX Batch Exporter"
@@ -661,66 +809,27 @@ class VRSE3D_PT_panel(Panel):
         # Info Box
         box_top = layout.box()
         
-        # Calculate what will be exported
-        allowed_types = self.get_allowed_types(props)
-        objects_to_check = []
-        fbx_count = 0
-
-        if props.export_mode == 'SELECTED':
-            selected_objs = [o for o in context.selected_objects if o.type in allowed_types]
-            box_top.label(text=f"Selected Objects: {len(selected_objs)}", icon='FILE_TICK')
-
-            if props.as_single_mesh and props.make_separate_folders:
-                coll_map = {}
-                for obj in selected_objs:
-                    for c in obj.users_collection:
-                        coll_map.setdefault(c, []).append(obj)
-                fbx_count = len(coll_map)
-                for group in coll_map.values():
-                    objects_to_check.extend(group)
-            elif props.as_single_mesh:
-                fbx_count = 1 if selected_objs else 0
-                objects_to_check = selected_objs
-            else:
-                fbx_count = len(selected_objs)
-                objects_to_check = selected_objs
-
-        else:  # COLLECTIONS Mode
-            all_visible = set()
-            def gather_layer_coll(lc, out):
-                if not lc.hide_viewport and not lc.collection.hide_viewport:
-                    out.add(lc.collection)
-                for ch in lc.children:
-                    gather_layer_coll(ch, out)
-            for lc in context.view_layer.layer_collection.children:
-                gather_layer_coll(lc, all_visible)
-
-            child_to_parent = {}
-            def build_map(lc, parent):
-                if not lc.hide_viewport and not lc.collection.hide_viewport:
-                    if parent is not None:
-                        child_to_parent[lc.collection] = parent
-                for ch in lc.children:
-                    build_map(ch, lc.collection)
-            for lc in context.view_layer.layer_collection.children:
-                build_map(lc, None)
-
-            top_level = [c for c in all_visible if c not in child_to_parent]
-            valid_colls = []
-            for c in top_level:
-                col_objs = [o for o in c.all_objects if o.type in allowed_types and not o.hide_viewport]
-                if col_objs:
-                    valid_colls.append(c)
-            fbx_count = len(valid_colls)
-            for coll in valid_colls:
-                for o in coll.all_objects:
-                    if o.type in allowed_types and not o.hide_viewport:
-                        objects_to_check.append(o)
-
-            box_top.label(text=f"Active Collections: {len(valid_colls)}", icon='FILE_TICK')
+        # Calculate what will be exported, reusing the last result while the
+        # scene and export options are unchanged
+        allowed_types = get_allowed_types(props)
+        token = (
+            _depsgraph_update_count,
+            context.view_layer.as_pointer(),
+            len(bpy.data.collections),
+            len(bpy.data.objects),
+            props.export_mode,
+            props.as_single_mesh,
+            props.make_separate_folders,
+            allowed_types,
+        )
+        if _panel_cache.get("token") != token:
+            _panel_cache["token"] = token
+            _panel_cache["summary"] = self.compute_export_summary(context, props, allowed_types)
+        info_text, fbx_count, has_2nd_uv = _panel_cache["summary"]
+
+        box_top.label(text=info_text, icon='FILE_TICK')
 
         # Show second UV map info
-        has_2nd_uv = all_have_2nd_uv_layer(objects_to_check)
         box_top.label(text=f"Export meshes have 2nd UV map Channel: {'YES' if has_2nd_uv else 'NO'}", icon='UV')
         box_top.label(text=f"Output FBX Count: {fbx_count}", icon='PACKAGE')
         
@@ -767,10 +876,7 @@ class VRSE3D_PT_panel(Panel):
 
         # 3. TRANSFORM COLLAPSE PANEL
         box_trans = layout.box()
-        row_trans = box_trans.row()
-        row_trans.prop(props, "show_transform", text="", icon="TRIA_DOWN" if props.show_transform else "TRIA_RIGHT", emboss=False)
-        row_trans.label(text="Transform")
-        if props.show_transform:
+        if _collapse_header(box_trans, props, "show_transform", "Transform"):
             box_trans.prop(props, "apply_unit")
             box_trans.prop(props, "use_space_transform")
             box_trans.prop(props, "apply_transform")
@@ -781,39 +887,58 @@ class VRSE3D_PT_panel(Panel):
 
         # 4. OTHER OPTIONS (combined section for export animations, embed textures, etc.)
         box_other = layout.box()
-        row_other = box_other.row()
-        row_other.prop(props, "show_other_options", text="", icon="TRIA_DOWN" if props.show_other_options else "TRIA_RIGHT", emboss=False)
-        row_other.label(text="Other Options")
-        
-        if props.show_other_options:
+        if _collapse_header(box_other, props, "show_other_options", "Other Options"):
             # Embed Textures
             box_other.prop(props, "embed_textures", text="Embed Textures")
-            
+
             # Export Animations
             box_other.prop(props, "export_animations", text="Export Animations")
-            
+
             # Smoothing
             box_other.prop(props, "export_smoothing", text="Smoothing")
-            
+
             # Object Types
             col = box_other.column(align=True)
             col.label(text="Object Types:")
-            col.prop(props, "export_empty")
-            col.prop(props, "export_camera")
-            col.prop(props, "export_lamp")
-            col.prop(props, "export_armature")
-            col.prop(props, "export_mesh")
-            col.prop(props, "export_other")
-
-    def get_allowed_types(self, props):
-        t = set()
-        if props.export_empty: t.add('EMPTY')
-        if props.export_camera: t.add('CAMERA')
-        if props.export_lamp: t.add('LIGHT')
-        if props.export_armature: t.add('ARMATURE')
-        if props.export_mesh: t.add('MESH')
-        if props.export_other: t.add('OTHER')
-        return t
+            for attr, _ in _OBJECT_TYPE_PROPS:
+                col.prop(props, attr)
+
+    def compute_export_summary(self, context, props, allowed_types):
+        """
+        Work out what an export would produce.
+        Returns (info_text, fbx_count, has_2nd_uv)
+        """
+        objects_to_check = []
+        fbx_count = 0
+
+        if props.export_mode == 'SELECTED':
+            selected_objs = [o for o in context.selected_objects if o.type in allowed_types]
+            info_text = f"Selected Objects: {len(selected_objs)}"
+
+            if props.as_single_mesh and props.make_separate_folders:
+                coll_map = gather_selected_by_collection(selected_objs)
+                fbx_count = len(coll_map)
+                for group in coll_map.values():
+                    objects_to_check.extend(group)
+            elif props.as_single_mesh:
+                fbx_count = 1 if selected_objs else 0
+                objects_to_check = selected_objs
+            else:
+                fbx_count = len(selected_objs)
+                objects_to_check = selected_objs
+
+        else:  # COLLECTIONS Mode
+            exportable = gather_exportable_objects(context, allowed_types)
+            top_level = gather_top_level_collections(context)
+            for c in top_level:
+                col_objs = [o for o in c.all_objects if o in exportable]
+                if col_objs:
+                    fbx_count += 1
+                    objects_to_check.extend(col_objs)
+
+            info_text = f"Active Collections: {fbx_count}"
+
+        return info_text, fbx_count, all_have_2nd_uv_layer(objects_to_check)
 
 
 # -----------------------------------------------------------------------------
@@ -828,16 +953,22 @@ classes = (
     VRSE3D_PT_panel,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
     bpy.types.Scene.vrsefbx_exporter = bpy.props.PointerProperty(type=VRseFbxExporterProperties)
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
 
 def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    _panel_cache.clear()
+    _uv_layer_counts.clear()
+    # Drop the pointer property before its class is unregistered
     if hasattr(bpy.types.Scene, "vrsefbx_exporter"):
         del bpy.types.Scene.vrsefbx_exporter
+    _unregister_classes()
 
 if __name__ == "__main__":
     register()
\ No newline at end of file